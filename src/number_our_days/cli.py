@@ -2,20 +2,16 @@ from __future__ import annotations
 
 import sys
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from pathlib import Path
 
-from reportlab.lib import colors
-from reportlab.lib.colors import HexColor
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-
 # Constants derived from recent CDC life expectancy summaries (circa 2023)
 MALE_LIFE_EXPECTANCY_YEARS = 75.8
 FEMALE_LIFE_EXPECTANCY_YEARS = 81.1
 WEEKS_PER_DISPLAY_YEAR = 52
 DISPLAY_YEARS = 90
 TOTAL_WEEKS = DISPLAY_YEARS * WEEKS_PER_DISPLAY_YEAR
+GRAY_HEX = "#AAAAAA"
 
 
 @dataclass
@@ -28,6 +24,7 @@ class UserInput:
 @dataclass
 class CalendarStats:
     birth_week_start: date
+    expectancy_years: float
     expectancy_weeks: int
     expectancy_week_index_m: int | None
     expectancy_week_index_f: int | None
@@ -46,10 +43,17 @@ def add_years_safe(d: date, years: int) -> date:
 
 
 def parse_birth_date(raw: str) -> date:
+    """Parse MM/DD/YYYY directly, avoiding the regex-backed strptime machinery."""
+    message = "Birth date must be in MM/DD/YYYY format and a valid date."
+    parts = raw.split("/")
+    widths_ok = len(parts) == 3 and 1 <= len(parts[0]) <= 2 and 1 <= len(parts[1]) <= 2 and len(parts[2]) == 4
+    if not widths_ok or not all(part.isascii() and part.isdigit() for part in parts):
+        raise ValueError(message)
+    month, day, year = (int(part) for part in parts)
     try:
-        parsed = datetime.strptime(raw, "%m/%d/%Y").date()
+        parsed = date(year, month, day)
     except ValueError as exc:  # noqa: BLE001
-        raise ValueError("Birth date must be in MM/DD/YYYY format and a valid date.") from exc
+        raise ValueError(message) from exc
     return parsed
 
 
@@ -58,13 +62,13 @@ def collect_user_input(debug: bool = False) -> UserInput:
 
     if debug:
         first = "debug"
-        birth_dt = add_years_safe(date.today(), -20)
+        birth_dt = add_years_safe(today, -20)
         gender = "M"
         print(f"DEBUG MODE: Using first_name={first}, birth_date={birth_dt}, gender={gender}")
-        print(f"Today: {date.today()}")
+        print(f"Today: {today}")
         print(f"Birth week start: {iso_week_start(birth_dt)}")
-        print(f"Current week start: {iso_week_start(date.today())}")
-        days_lived = (date.today() - birth_dt).days
+        print(f"Current week start: {iso_week_start(today)}")
+        days_lived = (today - birth_dt).days
         weeks_lived = days_lived // 7
         print(f"Days lived: {days_lived}, Weeks lived: {weeks_lived}")
         return UserInput(first_name=first, birth_date=birth_dt, gender=gender)
@@ -110,6 +114,7 @@ def compute_stats(user: UserInput) -> CalendarStats:
 
     return CalendarStats(
         birth_week_start=birth_week_start,
+        expectancy_years=expectancy_years,
         expectancy_weeks=expectancy_weeks,
         expectancy_week_index_m=expectancy_week_index_m,
         expectancy_week_index_f=expectancy_week_index_f,
@@ -117,6 +122,13 @@ def compute_stats(user: UserInput) -> CalendarStats:
 
 
 def draw_pdf(user: UserInput, stats: CalendarStats, output_path: Path) -> None:
+    # Import reportlab lazily so prompts and input errors don't pay for loading it
+    from reportlab.lib import colors
+    from reportlab.lib.colors import HexColor
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    gray = HexColor(GRAY_HEX)
     c = canvas.Canvas(str(output_path), pagesize=letter)
     width, height = letter
     today = date.today()
@@ -163,9 +175,9 @@ def draw_pdf(user: UserInput, stats: CalendarStats, output_path: Path) -> None:
     grid_width = WEEKS_PER_DISPLAY_YEAR * cell_size
     grid_left = (width - grid_width) / 2
 
-    def row_y(row_idx: int) -> float:
-        decade_jumps = row_idx // 10
-        return grid_top - (row_idx + 1) * cell_size - decade_jumps * decade_gap
+    # Precompute cell origins for each row and column
+    row_ys = tuple(grid_top - (row + 1) * cell_size - (row // 10) * decade_gap for row in range(DISPLAY_YEARS))
+    col_xs = tuple(grid_left + col * cell_size for col in range(WEEKS_PER_DISPLAY_YEAR))
 
     expectancy_m = stats.expectancy_week_index_m
     expectancy_f = stats.expectancy_week_index_f
@@ -176,64 +188,72 @@ def draw_pdf(user: UserInput, stats: CalendarStats, output_path: Path) -> None:
         age_years -= 1
     life_year_start = add_years_safe(user.birth_date, age_years)
     weeks_since_life_year_start = max((today - life_year_start).days // 7, 0)
-    current_row_birth = age_years
-    current_col_birth = weeks_since_life_year_start
-    lived_index_birth = age_years * WEEKS_PER_DISPLAY_YEAR + weeks_since_life_year_start
-
-    for week_index in range(TOTAL_WEEKS):
-        row = week_index // WEEKS_PER_DISPLAY_YEAR
-        col = week_index % WEEKS_PER_DISPLAY_YEAR
-        if row >= DISPLAY_YEARS:
-            break
-
-        x = grid_left + col * cell_size
-        y = row_y(row)
-
-        # Determine current/lived status
-        # Current week sticks to birth-based week index until the first 7 days complete
-        is_current_week = row == current_row_birth and col == current_col_birth
-        is_lived = week_index < lived_index_birth
+    current_week_index = age_years * WEEKS_PER_DISPLAY_YEAR + weeks_since_life_year_start
 
+    # Fill each decade block white, then overlay the lived weeks in gray.
+    # Lived weeks are always a contiguous prefix: whole rows plus a partial row.
+    lived_end = min(current_week_index, TOTAL_WEEKS)
+    lived_rows, lived_cols = divmod(lived_end, WEEKS_PER_DISPLAY_YEAR)
+    c.setFillColor(colors.white)
+    for decade_start in range(0, DISPLAY_YEARS, 10):
+        c.rect(grid_left, row_ys[decade_start + 9], grid_width, 10 * cell_size, stroke=0, fill=1)
+    c.setFillColor(gray)
+    for decade_start in range(0, lived_rows, 10):
+        rows = min(lived_rows - decade_start, 10)
+        c.rect(grid_left, row_ys[decade_start + rows - 1], grid_width, rows * cell_size, stroke=0, fill=1)
+    if lived_cols:
+        c.rect(grid_left, row_ys[lived_rows], lived_cols * cell_size, cell_size, stroke=0, fill=1)
+
+    # Stroke the cell lattice one decade block at a time so the gaps between blocks stay open
+    x_edges = [*col_xs, grid_left + grid_width]
+    c.setStrokeColor(colors.black)
+    c.setLineWidth(1)
+    # Square caps close the block corners the way stroked cell rects did
+    c.setLineCap(2)
+    for decade_start in range(0, DISPLAY_YEARS, 10):
+        y_edges = [row_ys[row] + cell_size for row in range(decade_start, decade_start + 10)]
+        y_edges.append(row_ys[decade_start + 9])
+        c.grid(x_edges, y_edges)
+    c.setLineCap(0)
+
+    # Current week sticks to birth-based week index until the first 7 days complete
+    if age_years < DISPLAY_YEARS and weeks_since_life_year_start < WEEKS_PER_DISPLAY_YEAR:
+        current_row, current_col = divmod(current_week_index, WEEKS_PER_DISPLAY_YEAR)
+        x = col_xs[current_col]
+        y = row_ys[current_row]
+        c.setFillColor(colors.blue)
         c.setStrokeColor(colors.black)
         c.setLineWidth(1)
-
-        if is_lived:
-            c.setFillColor(HexColor("#AAAAAA"))
-        else:
-            c.setFillColor(colors.white)
         c.rect(x, y, cell_size, cell_size, stroke=1, fill=1)
-
-        if is_current_week:
-            c.setFillColor(colors.blue)
-            c.setStrokeColor(colors.black)
-            c.setLineWidth(1)
-            c.rect(x, y, cell_size, cell_size, stroke=1, fill=1)
-            # Draw white diamond in center
-            diamond_size = cell_size * 0.3
-            center_x_cell = x + cell_size / 2
-            center_y_cell = y + cell_size / 2
-            p = c.beginPath()
-            p.moveTo(center_x_cell, center_y_cell + diamond_size)
-            p.lineTo(center_x_cell + diamond_size, center_y_cell)
-            p.lineTo(center_x_cell, center_y_cell - diamond_size)
-            p.lineTo(center_x_cell - diamond_size, center_y_cell)
-            p.close()
-            c.setFillColor(colors.white)
-            c.setStrokeColor(colors.white)
-            c.drawPath(p, stroke=1, fill=1)
-
-        if (expectancy_m is not None and week_index == expectancy_m) or (
-            expectancy_f is not None and week_index == expectancy_f
-        ):
-            # Draw red X across the box
-            margin = cell_size * 0.15
-            c.setStrokeColor(colors.red)
-            c.setLineWidth(1.5)
-            # Draw diagonal lines forming an X
-            c.line(x + margin, y + margin, x + cell_size - margin, y + cell_size - margin)
-            c.line(x + margin, y + cell_size - margin, x + cell_size - margin, y + margin)
-            c.setStrokeColor(colors.black)
-            c.setLineWidth(1)
+        # Draw white diamond in center
+        diamond_size = cell_size * 0.3
+        center_x_cell = x + cell_size / 2
+        center_y_cell = y + cell_size / 2
+        p = c.beginPath()
+        p.moveTo(center_x_cell, center_y_cell + diamond_size)
+        p.lineTo(center_x_cell + diamond_size, center_y_cell)
+        p.lineTo(center_x_cell, center_y_cell - diamond_size)
+        p.lineTo(center_x_cell - diamond_size, center_y_cell)
+        p.close()
+        c.setFillColor(colors.white)
+        c.setStrokeColor(colors.white)
+        c.drawPath(p, stroke=1, fill=1)
+
+    for expectancy_index in (expectancy_m, expectancy_f):
+        if expectancy_index is None or expectancy_index >= TOTAL_WEEKS:
+            continue
+        row, col = divmod(expectancy_index, WEEKS_PER_DISPLAY_YEAR)
+        x = col_xs[col]
+        y = row_ys[row]
+        # Draw red X across the box
+        margin = cell_size * 0.15
+        c.setStrokeColor(colors.red)
+        c.setLineWidth(1.5)
+        # Draw diagonal lines forming an X
+        c.line(x + margin, y + margin, x + cell_size - margin, y + cell_size - margin)
+        c.line(x + margin, y + cell_size - margin, x + cell_size - margin, y + margin)
+        c.setStrokeColor(colors.black)
+        c.setLineWidth(1)
 
     # Draw decade labels
     c.setFillColor(colors.black)
@@ -243,16 +263,13 @@ def draw_pdf(user: UserInput, stats: CalendarStats, output_path: Path) -> None:
         row = decade - 1  # Show label at bottom of each decade block
         if row >= DISPLAY_YEARS:
             continue
-        y = row_y(row) + cell_size / 2
+        y = row_ys[row] + cell_size / 2
         c.drawString(grid_right + 6, y - 3, str(decade))
 
     # Reset to black for drawing
     c.setFillColor(colors.black)
     c.setStrokeColor(colors.black)
 
-    # Get life expectancy for legend
-    expectancy_years = MALE_LIFE_EXPECTANCY_YEARS if user.gender == "M" else FEMALE_LIFE_EXPECTANCY_YEARS
-
     # Draw Legend to the right of grid, aligned at top
     legend_x = grid_left + WEEKS_PER_DISPLAY_YEAR * cell_size + 32
     legend_y_start = grid_top - cell_size
@@ -264,7 +281,7 @@ def draw_pdf(user: UserInput, stats: CalendarStats, output_path: Path) -> None:
 
     # Gray box - Weeks already lived
     y1 = legend_y_start
-    c.setFillColor(HexColor("#AAAAAA"))
+    c.setFillColor(gray)
     c.setStrokeColor(colors.black)
     c.setLineWidth(0.5)
     c.rect(legend_x, y1 - 6, box_size, box_size, stroke=1, fill=1)
@@ -317,7 +334,7 @@ def draw_pdf(user: UserInput, stats: CalendarStats, output_path: Path) -> None:
     c.setFillColor(colors.black)
     c.setStrokeColor(colors.black)
     c.setLineWidth(0.5)
-    c.drawString(text_x, y4 - 4, f"Life expectancy: {expectancy_years}")
+    c.drawString(text_x, y4 - 4, f"Life expectancy: {stats.expectancy_years}")
 
     # Draw box around legend
     legend_padding = 6
@@ -332,7 +349,7 @@ def draw_pdf(user: UserInput, stats: CalendarStats, output_path: Path) -> None:
     summary_col_x = center_x
 
     # Use grid-aligned lived week count so summary matches shading
-    display_weeks_lived = max(lived_index_birth, 0)
+    display_weeks_lived = max(current_week_index, 0)
 
     weeks_remaining = max(stats.expectancy_weeks - display_weeks_lived, 0)
     percent_lived = (